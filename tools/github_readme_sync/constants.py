@@ -10,18 +10,30 @@
 
 import re
 
-IGNORE_DOCS = ["placeholder-example-doc", "some-existing-doc"]
-IGNORE_IMAGES = ["docs-only-example.png"]
-IGNORE_TABLES = ["example-table-for-docs.csv"]
-IGNORE_YOUTUBE = ["example-video-id"]
-IGNORE_CLOUDINARY = ["example-video.mp4"]
+IGNORE_DOCS = frozenset({"placeholder-example-doc", "some-existing-doc"})
+IGNORE_IMAGES = frozenset({"docs-only-example.png"})
+IGNORE_TABLES = frozenset({"example-table-for-docs.csv"})
+IGNORE_YOUTUBE = frozenset({"example-video-id"})
+IGNORE_CLOUDINARY = frozenset({"example-video.mp4"})
 
-IGNORE_EXTERNAL_URLS = [
-    "openai.com",
-    "science.org",
-    "annualreviews.org",
-    "sciencedirect.com",
-]
+IGNORE_EXTERNAL_URLS = frozenset(
+    {
+        "openai.com",
+        "science.org",
+        "annualreviews.org",
+        "sciencedirect.com",
+    }
+)
+
+# Ignored docs, images, and external URLs are matched by substring, so the
+# checks are a single regex scan rather than a Python-level loop over the set.
+REGEX_IGNORE_DOC = re.compile("|".join(re.escape(slug) for slug in sorted(IGNORE_DOCS)))
+REGEX_IGNORE_IMAGE = re.compile(
+    "|".join(re.escape(name) for name in sorted(IGNORE_IMAGES))
+)
+REGEX_IGNORE_EXTERNAL_URL = re.compile(
+    "|".join(re.escape(url) for url in sorted(IGNORE_EXTERNAL_URLS))
+)
 
 # Regex for CSV table references
 REGEX_CSV_TABLE = re.compile(r"!table\[(.+?)\]")
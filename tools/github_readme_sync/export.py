@@ -8,6 +8,7 @@
 # license that can be found in the LICENSE file or at
 # https://opensource.org/licenses/MIT.
 
+import concurrent.futures
 import logging
 import shutil
 from pathlib import Path
@@ -45,26 +46,51 @@ def export(output_dir: str, rdme: ReadMe):
         category_folder_path.mkdir(exist_ok=True, parents=True)
 
         docs_from_server = rdme.get_category_docs(category)
-        for server_doc in docs_from_server:
-            hierarchy_doc = {
-                "title": server_doc["title"],
-                "slug": slugify(server_doc["title"]),
-                "children": [],
-            }
-            category_entry["children"].append(hierarchy_doc)
-
-            # Call process_doc with named parameters
-            process_doc(
-                server_doc=server_doc,
-                hierarchy_doc=hierarchy_doc,
-                folder_path=category_folder_path,
-                indent_level=0,
-                rdme=rdme,
-            )
+
+        # Create the whole folder tree for this category up front so
+        # process_doc can write files without per-doc mkdir calls.
+        create_doc_folders(docs_from_server, category_folder_path)
+
+        # Each top-level doc is an independent subtree, so fetch and write
+        # them concurrently. The hierarchy entries are appended up front to
+        # keep their order deterministic.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = []
+            for server_doc in docs_from_server:
+                hierarchy_doc = {
+                    "title": server_doc["title"],
+                    "slug": slugify(server_doc["title"]),
+                    "children": [],
+                }
+                category_entry["children"].append(hierarchy_doc)
+
+                futures.append(
+                    executor.submit(
+                        process_doc,
+                        server_doc=server_doc,
+                        hierarchy_doc=hierarchy_doc,
+                        folder_path=category_folder_path,
+                        indent_level=0,
+                        rdme=rdme,
+                    )
+                )
+
+            for future in futures:
+                future.result()
 
     return hierarchy
 
 
+def create_doc_folders(server_docs, folder_path: Path):
+    """Create the folder for every doc with children in a single pass."""
+    for server_doc in server_docs:
+        children = server_doc.get("children", [])
+        if children:
+            child_folder_path = folder_path / slugify(server_doc["title"])
+            child_folder_path.mkdir(exist_ok=True, parents=True)
+            create_doc_folders(children, child_folder_path)
+
+
 def process_doc(*, server_doc, hierarchy_doc, folder_path, indent_level, rdme):
     indent = INDENTATION_UNIT * indent_level
     logging.info(f"{indent}{CYAN}{hierarchy_doc['slug']}{RESET}")
@@ -74,9 +100,7 @@ def process_doc(*, server_doc, hierarchy_doc, folder_path, indent_level, rdme):
         f.write(rdme.get_doc_by_slug(server_doc["slug"]))
 
     children = server_doc.get("children", [])
-    if children:
-        child_folder_path = folder_path / hierarchy_doc["slug"]
-        child_folder_path.mkdir(exist_ok=True, parents=True)
+    child_folder_path = folder_path / hierarchy_doc["slug"]
 
     for child in children:
         child_entry = {
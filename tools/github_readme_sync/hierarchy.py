@@ -19,15 +19,31 @@ import requests
 
 from tools.github_readme_sync.colors import CYAN, GREEN, RED, RESET, WHITE, YELLOW
 from tools.github_readme_sync.constants import (
-    IGNORE_DOCS,
-    IGNORE_EXTERNAL_URLS,
-    IGNORE_IMAGES,
     IGNORE_TABLES,
     REGEX_CSV_TABLE,
+    REGEX_IGNORE_DOC,
+    REGEX_IGNORE_EXTERNAL_URL,
+    REGEX_IGNORE_IMAGE,
 )
 from tools.github_readme_sync.file import find_markdown_files, read_file_content
 
 HIERARCHY_FILE = "hierarchy.md"
+
+# Unrolled-loop form of "<!--.*?-->" (no DOTALL needed) so an unterminated
+# comment cannot trigger quadratic backtracking on large files.
+REGEX_HTML_COMMENT = re.compile(r"<!--[^-]*(?:-(?!->)[^-]*)*-->")
+REGEX_SLUG_LINK = re.compile(r"\[(.*)\]\(.*\)")
+REGEX_MD_LINK = re.compile(r"\[([^\]]*)\]\(([^)]+\.md(?:#[^)]*)?)\)")
+REGEX_FIGURE_LINK = re.compile(
+    r"(?:\.\./)*figures/[^\s\)\"\']+(?:\.png|\.jpg|\.jpeg|\.gif|\.svg|\.webp|\s)"
+)
+REGEX_EXTERNAL_LINKS = (
+    re.compile(r"\[[^\]]*\]\(([^)]+)\)"),
+    re.compile(r'<a[^>]+href="([^"]+)"'),
+    re.compile(r"<a[^>]+href='([^']+)'"),
+    re.compile(r'<img[^>]+src="([^"]+)"'),
+    re.compile(r"<img[^>]+src='([^']+)'"),
+)
 CATEGORY_PREFIX = "# "
 DOCUMENT_PREFIX = "- "
 INDENTATION_UNIT = "  "  # Single indentation level
@@ -79,7 +95,7 @@ def check_hierarchy_file(folder: str):
 
     with hierarchy_file.open() as f:
         content = f.read()
-        content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+        content = REGEX_HTML_COMMENT.sub("", content)
         lines = content.splitlines()
 
     parent_stack = []
@@ -128,8 +144,7 @@ def check_hierarchy_file(folder: str):
 
 
 def extract_slug(line: str):
-    regex = r"\[(.*)\]\(.*\)"
-    match = re.search(regex, line)
+    match = REGEX_SLUG_LINK.search(line)
     return match.group(1)
 
 
@@ -146,20 +161,23 @@ def check_links(path):
         content = f.read()
     file_name = path.name
 
-    regex_md_links = r"\[([^\]]*)\]\(([^)]+\.md(?:#[^)]*)?)\)"
-    md_link_matches = re.findall(regex_md_links, content)
+    md_link_matches = REGEX_MD_LINK.findall(content)
 
-    table_matches = re.findall(REGEX_CSV_TABLE, content)
+    table_matches = REGEX_CSV_TABLE.findall(content)
 
-    regex_figures = (
-        r"(?:\.\./)*figures/[^\s\)\"\']+(?:\.png|\.jpg|\.jpeg|\.gif|\.svg|\.webp|\s)"
-    )
-    image_link_matches = re.findall(regex_figures, content)
+    image_link_matches = REGEX_FIGURE_LINK.findall(content)
+    # Lazy %-formatting: these run per file and are filtered out above DEBUG.
     logging.debug(
-        f"{WHITE}{file_name}"
-        f"{GREEN} {len(md_link_matches)} links"
-        f"{CYAN} {len(image_link_matches)} images"
-        f"{YELLOW} {len(table_matches)} tables{RESET}"
+        "%s%s%s %d links%s %d images%s %d tables%s",
+        WHITE,
+        file_name,
+        GREEN,
+        len(md_link_matches),
+        CYAN,
+        len(image_link_matches),
+        YELLOW,
+        len(table_matches),
+        RESET,
     )
 
     current_dir = path.resolve().parent
@@ -179,17 +197,17 @@ def check_links(path):
             continue
 
         path_to_check = current_dir / match[1].split("#")[0]
-        if any(placeholder in match[1] for placeholder in IGNORE_DOCS):
+        if REGEX_IGNORE_DOC.search(match[1]):
             continue
-        logging.debug(f"{GREEN}  {path_to_check.name}{RESET}")
+        logging.debug("%s  %s%s", GREEN, path_to_check.name, RESET)
         if not path_to_check.exists():
             errors.append(f"  Linked {match[1]} does not exist")
 
     for match in image_link_matches:
         path_to_check = current_dir / match.split("#")[0]
-        if any(placeholder in match for placeholder in IGNORE_IMAGES):
+        if REGEX_IGNORE_IMAGE.search(match):
             continue
-        logging.debug(f"{CYAN}  {path_to_check.name}{RESET}")
+        logging.debug("%s  %s%s", CYAN, path_to_check.name, RESET)
         if not path_to_check.exists():
             errors.append(f"  Image {path_to_check} does not exist")
 
@@ -227,7 +245,7 @@ def check_external(folder, ignore_dirs, rdme):
 
 
 def process_file(file_path, rdme, url_cache):
-    logging.debug(f"{WHITE}{file_path}{RESET}")
+    logging.debug("%s%s%s", WHITE, file_path, RESET)
     file_errors = []
     content = read_file_content(file_path)
     all_links = extract_external_links(content)
@@ -257,13 +275,10 @@ def process_file(file_path, rdme, url_cache):
 
 
 def extract_external_links(content):
-    return (
-        re.findall(r"\[[^\]]*\]\(([^)]+)\)", content)
-        + re.findall(r'<a[^>]+href="([^"]+)"', content)
-        + re.findall(r"<a[^>]+href=\'([^\']+)\'", content)
-        + re.findall(r'<img[^>]+src="([^"]+)"', content)
-        + re.findall(r"<img[^>]+src=\'([^\']+)\'", content)
-    )
+    links = []
+    for pattern in REGEX_EXTERNAL_LINKS:
+        links.extend(pattern.findall(content))
+    return links
 
 
 def is_readme_url(url):
@@ -298,7 +313,7 @@ def check_readme_link(url, rdme):
 
 
 def check_external_link(url):
-    if any(ignored_url in url for ignored_url in IGNORE_EXTERNAL_URLS):
+    if REGEX_IGNORE_EXTERNAL_URL.search(url):
         logging.info(f"{WHITE}{url} {GREEN}[IGNORED]{RESET}")
         return []
 
@@ -96,9 +96,21 @@ def generate_index(docs_dir: str, output_file_path: Path):
 
     entries = process_markdown_files(docs_dir)
 
+    # Serialize once and skip the write when the file already matches, so
+    # repeated runs don't touch the output's mtime.
+    output = json.dumps(entries, indent=2, ensure_ascii=False)
     output_file_path.parent.mkdir(exist_ok=True, parents=True)
-    with output_file_path.open("w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
+    try:
+        if output_file_path.read_text(encoding="utf-8") == output:
+            logger.info(f"{GREEN}Index unchanged: {output_file_path}{RESET}")
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Write to a sibling temp file and rename it into place atomically, so a
+    # crash mid-write never leaves a truncated index behind.
+    tmp_path = output_file_path.with_suffix(output_file_path.suffix + ".tmp")
+    tmp_path.write_text(output, encoding="utf-8")
+    tmp_path.replace(output_file_path)
 
     logger.info(
         f"{GREEN}Generated index with {len(entries)} entries: {output_file_path}{RESET}"
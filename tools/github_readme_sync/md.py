@@ -8,12 +8,26 @@
 # license that can be found in the LICENSE file or at
 # https://opensource.org/licenses/MIT.
 
+import re
+
 import yaml
 
+try:
+    # The C loader parses frontmatter an order of magnitude faster than the
+    # pure-Python one; fall back when libyaml bindings are unavailable.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Splits a document into frontmatter (group 1) and body (group 2) in a single
+# pass, so callers don't re-split the content per field.
+REGEX_FRONTMATTER = re.compile(r"\A---(.*?)---\n?(.*)\Z", re.DOTALL)
+
 
 def process_markdown(body: str, slug: str) -> dict:
     doc = {"title": "", "body": "", "hidden": False, "slug": slug}
-    frontmatter = parse_frontmatter(body)
+    match = REGEX_FRONTMATTER.match(body)
+    frontmatter = yaml.load(match.group(1), Loader=SafeLoader) if match else {}
     if not frontmatter:
         raise ValueError("No frontmatter found in the document")
     doc["title"] = frontmatter.get("title", "")
@@ -21,17 +35,13 @@ def process_markdown(body: str, slug: str) -> dict:
     if "description" in frontmatter:
         doc["description"] = frontmatter.get("description", "")
 
-    body = body.split("---\n", maxsplit=2)
-    if len(body) > 2:
-        doc["body"] = body[2]
-    else:
-        doc["body"] = body[0]
+    doc["body"] = match.group(2)
 
     return doc
 
 
 def parse_frontmatter(file_content):
-    if file_content.startswith("---"):
-        _, frontmatter, _ = file_content.split("---", 2)
-        return yaml.safe_load(frontmatter)
+    match = REGEX_FRONTMATTER.match(file_content)
+    if match:
+        return yaml.load(match.group(1), Loader=SafeLoader)
     return {}
@@ -17,9 +17,11 @@ import os
 import re
 from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, quote
+from urllib.parse import quote, unquote_plus
 
 import nh3
 import yaml
@@ -27,34 +29,128 @@ import yaml
 from tools.github_readme_sync.colors import GRAY, GREEN, RESET
 from tools.github_readme_sync.constants import (
     IGNORE_CLOUDINARY,
-    IGNORE_DOCS,
     IGNORE_IMAGES,
     IGNORE_TABLES,
     IGNORE_YOUTUBE,
     REGEX_CSV_TABLE,
+    REGEX_IGNORE_DOC,
+    REGEX_IGNORE_IMAGE,
 )
 from tools.github_readme_sync.req import delete, get, post, put
 
 PREFIX = "https://dash.readme.com/api/v1"
 GITHUB_RAW = "https://raw.githubusercontent.com"
 
-regex_images = re.compile(r"!\[(.*?)\]\((.*?)\)")
+# Negated character classes instead of lazy .*? so the engine advances
+# without backtracking on long bodies.
+regex_images = re.compile(r"!\[([^\]\n]*)\]\(([^)\n]*)\)")
+# The filename class excludes quotes, parens, and whitespace so that two
+# figure paths on one line match separately instead of one greedy span.
 regex_image_path = re.compile(
-    r"(\.\./){1,5}figures/((.+)\.(png|jpg|jpeg|gif|svg|webp))"
+    r"(\.\./){1,5}figures/(([^\s\"'()]+)\.(png|jpg|jpeg|gif|svg|webp))"
 )
 regex_markdown_path = re.compile(r"\(([\./]*)([\w\-/]+)\.md(#.*?)?\)")
 regex_cloudinary_video = re.compile(
-    r"^\s*\[(.*?)\]\((https://res\.cloudinary\.com/([^/]+)/video/upload/v(\d+)/([^/]+\.mp4))\)\s*$",
+    r"^\s*\[(.*?)\]\((https://res\.cloudinary\.com/(?P<cl_cloud>[^/]+)/video/upload/v(?P<cl_version>\d+)/(?P<cl_file>[^/]+\.mp4))\)\s*$",
     re.IGNORECASE | re.MULTILINE,
 )
 regex_youtube_link = re.compile(
-    r"^\s*\[(.*?)\]\((?:https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})(?:[&?][^\)]*)?)\)\s*$",
+    r"^\s*\[(?P<yt_title>.*?)\]\((?:https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)(?P<yt_id>[a-zA-Z0-9_-]{11})(?:[&?][^\)]*)?)\)\s*$",
     re.IGNORECASE | re.MULTILINE,
 )
-regex_markdown_snippet = re.compile(r"!snippet\[(.*?)\]")
+# Both video patterns fused into one alternation so process_markdown can
+# convert videos in a single scan of the body.
+regex_video_link = re.compile(
+    f"(?P<cloudinary>{regex_cloudinary_video.pattern})"
+    f"|(?P<youtube>{regex_youtube_link.pattern})",
+    re.IGNORECASE | re.MULTILINE,
+)
+regex_markdown_snippet = re.compile(r"!snippet\[([^\]\n]*)\]")
+regex_note_tag = re.compile(r"\[!(NOTE|TIP|IMPORTANT|WARNING|CAUTION)\]")
+
+NOTE_TAG_EMOJI = {
+    "NOTE": "📘",
+    "TIP": "👍",
+    "IMPORTANT": "📘",
+    "WARNING": "🚧",
+    "CAUTION": "❗️",
+}
 
 # Allowlist of supported CSS properties
-ALLOWED_CSS_PROPERTIES = {"width", "height"}
+ALLOWED_CSS_PROPERTIES = frozenset({"width", "height"})
+
+# nh3 attribute allowlists, hoisted so the hot callbacks don't rebuild them
+# per match
+IMAGE_ATTRIBUTES = {"img": {"src", "align", "style"}}
+TABLE_ATTRIBUTES = {
+    "div": {"class"},
+    "th": {"title", "style"},
+    "td": {"style"},
+}
+
+
+def _build_sanitize_allowlists() -> tuple[set, dict]:
+    """Extend the nh3 defaults with the tags and attributes snippets may use.
+
+    Built once at import time; sanitize_html previously deep-copied and
+    mutated the nh3 defaults on every call.
+
+    Returns:
+        Tuple of (allowed tags, allowed attributes per tag)
+    """
+    tags = set(nh3.ALLOWED_TAGS) | {"style", "a", "label"}
+    attributes = deepcopy(nh3.ALLOWED_ATTRIBUTES)
+    for tag_attributes in attributes.values():
+        tag_attributes.update(("width", "style", "target", "class"))
+    return tags, attributes
+
+
+SANITIZE_TAGS, SANITIZE_ATTRIBUTES = _build_sanitize_allowlists()
+
+
+def _sanitize_html(body: str) -> str:
+    return nh3.clean(
+        body,
+        tags=SANITIZE_TAGS,
+        attributes=SANITIZE_ATTRIBUTES,
+        link_rel=None,
+        strip_comments=False,
+        generic_attribute_prefixes={"data-"},
+        clean_content_tags={"script"},
+    )
+
+
+@lru_cache(maxsize=None)
+def _sanitized_snippet_cached(path: str) -> str:
+    """Read and sanitize a snippet once per resolved path.
+
+    The edit-this-page snippet is appended to every document, so caching
+    the sanitized result turns N clean passes into one.
+
+    Args:
+        path: Resolved path to the snippet file
+
+    Returns:
+        Sanitized snippet content
+    """
+    return _sanitize_html(_read_file_cached(path))
+
+
+@lru_cache(maxsize=None)
+def _read_file_cached(path: str) -> str:
+    """Read a file once per resolved path.
+
+    Snippets and CSV tables are often referenced from many documents;
+    caching by path turns N references into a single read. Failed reads
+    are not cached, so callers' error handling is unchanged.
+
+    Args:
+        path: Resolved path to the file to read
+
+    Returns:
+        File content as string
+    """
+    return Path(path).read_text()
 
 
 class OrderedDumper(yaml.SafeDumper):
@@ -71,6 +167,8 @@ OrderedDumper.add_representer(OrderedDict, _dict_representer)
 class ReadMe:
     def __init__(self, version: str):
         self.version = version
+        self._stable_version: str | None = None
+        self._image_repo: str | None = None
 
     def get_categories(self) -> list[Any]:
         categories = get(f"{PREFIX}/categories", {"x-readme-version": self.version})
@@ -205,6 +303,9 @@ class ReadMe:
         Returns:
             The document body with CSV tables converted to HTML format.
         """
+        # Cheap substring scan before the regex pass; most docs have no tables.
+        if "!table[" not in body:
+            return body
 
         def replace_match(match):
             csv_path = Path(match.group(1))
@@ -217,55 +318,51 @@ class ReadMe:
             csv_path = csv_path.resolve()
 
             try:
-                with csv_path.open() as f:
-                    reader = csv.reader(f)
-                    headers = next(reader)
-                    rows = list(reader)
-
-                    # Build unsafe HTML table
-                    unsafe_html = "<div class='data-table'><table>\n<thead>\n<tr>"
-
-                    # Process headers and build alignment lookup
-                    alignments = {}
-                    for i, unparsed_header in enumerate(headers):
-                        title_attr = ""
-                        align_style = ""
-                        parts = [p.strip() for p in unparsed_header.split("|")]
-                        header = parts[0]
-
-                        # Process additional attributes in any order
-                        for part in parts[1:]:
-                            if part.startswith("hover "):
-                                hover_text = html.escape(part[6:])
-                                title_attr = f" title='{hover_text}'"
-                            elif part.startswith("align "):
-                                align_value = part[6:]
-                                self.validate_csv_align_param(align_value)
-                                alignments[i] = (
-                                    f" style='text-align:{html.escape(align_value)}'"
-                                )
-                        unsafe_html += f"<th{title_attr}>{header}</th>"
-                    unsafe_html += "</tr>\n</thead>\n<tbody>\n"
-
-                    # Add rows using stored alignments
-                    for row in rows:
-                        unsafe_html += "<tr>"
-                        for i, cell in enumerate(row):
-                            align_style = alignments.get(i, "")
-                            unsafe_html += f"<td{align_style}>{cell}</td>"
-                        unsafe_html += "</tr>\n"
-
-                    unsafe_html += "</tbody>\n</table></div>"
-
-                    # Clean and return the HTML
-                    return nh3.clean(
-                        unsafe_html,
-                        attributes={
-                            "div": {"class"},
-                            "th": {"title", "style"},
-                            "td": {"style"},
-                        },
-                    )
+                reader = csv.reader(StringIO(_read_file_cached(str(csv_path))))
+                headers = next(reader)
+
+                # Accumulate the table in a list and join once; += string
+                # growth is quadratic on large tables.
+                parts_html = ["<div class='data-table'><table>\n<thead>\n<tr>"]
+
+                # Process headers and build alignment lookup
+                alignments = {}
+                for i, unparsed_header in enumerate(headers):
+                    title_attr = ""
+                    align_style = ""
+                    parts = [p.strip() for p in unparsed_header.split("|")]
+                    header = parts[0]
+
+                    # Process additional attributes in any order
+                    for part in parts[1:]:
+                        if part.startswith("hover "):
+                            hover_text = html.escape(part[6:])
+                            title_attr = f" title='{hover_text}'"
+                        elif part.startswith("align "):
+                            align_value = part[6:]
+                            self.validate_csv_align_param(align_value)
+                            alignments[i] = (
+                                f" style='text-align:{html.escape(align_value)}'"
+                            )
+                    parts_html.append(f"<th{title_attr}>{header}</th>")
+                parts_html.append("</tr>\n</thead>\n<tbody>\n")
+
+                # Add rows using stored alignments, streaming straight
+                # from the reader rather than materializing the file.
+                for row in reader:
+                    parts_html.append("<tr>")
+                    for i, cell in enumerate(row):
+                        align_style = alignments.get(i, "")
+                        parts_html.append(f"<td{align_style}>{cell}</td>")
+                    parts_html.append("</tr>\n")
+
+                parts_html.append("</tbody>\n</table></div>")
+
+                # Clean and return the HTML
+                return nh3.clean(
+                    "".join(parts_html),
+                    attributes=TABLE_ATTRIBUTES,
+                )
 
             except Exception as e:  # noqa: BLE001
                 return f"[Failed to load table from {csv_path} - {e}]"
@@ -291,9 +388,15 @@ class ReadMe:
         if "description" in doc:
             create_doc_request["excerpt"] = doc["description"]
 
-        doc_id = self.get_doc_id(doc["slug"])
+        existing_doc = get(
+            f"{PREFIX}/docs/{doc['slug']}", {"x-readme-version": self.version}
+        )
+        doc_id = existing_doc["_id"] if existing_doc else None
         created = doc_id is None
         if doc_id:
+            if self._doc_unchanged(existing_doc, create_doc_request):
+                logging.info(f"{GRAY}Doc {doc['slug']} unchanged, skipping{RESET}")
+                return doc_id, created
             if not put(
                 f"{PREFIX}/docs/{doc['slug']}",
                 create_doc_request,
@@ -310,6 +413,27 @@ class ReadMe:
 
         return doc_id, created
 
+    def _doc_unchanged(self, existing_doc: dict, create_doc_request: dict) -> bool:
+        """Check whether a doc on the server already matches the pending request.
+
+        Comparison is conservative: any missing or differing field counts as
+        changed, so a doc is only skipped when the update would be a no-op.
+
+        Args:
+            existing_doc: The doc as returned by the ReadMe API
+            create_doc_request: The pending create/update request body
+
+        Returns:
+            True if the update can be skipped.
+        """
+        if any(
+            existing_doc.get(key) != value for key, value in create_doc_request.items()
+        ):
+            return False
+        # A doc with a server-side excerpt but none in the request still needs
+        # an update to clear it.
+        return "excerpt" in create_doc_request or not existing_doc.get("excerpt")
+
     def process_markdown(self, body: str, file_path: str, slug: str) -> str:
         body = self.insert_edit_this_page(body, slug, file_path)
         body = self.insert_markdown_snippet(body, file_path)
@@ -318,31 +442,10 @@ class ReadMe:
         body = self.correct_file_locations(body)
         body = self.convert_note_tags(body)
         body = self.parse_images(body)
-        body = self.convert_cloudinary_videos(body)
-        return self.convert_youtube_videos(body)
+        return self.convert_videos(body)
 
     def sanitize_html(self, body: str) -> str:
-        allowed_attributes = deepcopy(nh3.ALLOWED_ATTRIBUTES)
-        allowed_tags = deepcopy(nh3.ALLOWED_TAGS)
-
-        allowed_tags.add("style")
-        allowed_tags.add("a")
-        allowed_tags.add("label")
-        for tag in allowed_attributes:
-            allowed_attributes[tag].add("width")
-            allowed_attributes[tag].add("style")
-            allowed_attributes[tag].add("target")
-            allowed_attributes[tag].add("class")
-
-        return nh3.clean(
-            body,
-            tags=allowed_tags,
-            attributes=allowed_attributes,
-            link_rel=None,
-            strip_comments=False,
-            generic_attribute_prefixes={"data-"},
-            clean_content_tags={"script"},
-        )
+        return _sanitize_html(body)
 
     def insert_edit_this_page(self, body: str, filename: str, file_path: str) -> str:
         depth = len(file_path.split("/")) - 1
@@ -350,16 +453,24 @@ class ReadMe:
         relative_path = relative_path + "snippets/edit-this-page.md"
         body = body + f"\n\n!snippet[{relative_path}]"
         body = self.insert_markdown_snippet(body, file_path)
+        # The placeholder comes from the single snippet appended above, so
+        # stop after the first replacement instead of scanning the tail.
         return body.replace(
             "!!LINK!!",
             f"https://github.com/thousandbrainsproject/tbp.monty/edit/main/{file_path}/{filename}.md",
+            1,
         )
 
     def correct_image_locations(self, body: str) -> str:
-        repo = os.getenv("IMAGE_PATH")
-        if not repo:
-            raise ValueError("IMAGE_PATH environment variable not set")
-        new_body = body
+        # Resolve IMAGE_PATH once per instance rather than per document.
+        repo = self._image_repo
+        if repo is None:
+            repo = os.getenv("IMAGE_PATH")
+            if not repo:
+                raise ValueError("IMAGE_PATH environment variable not set")
+            self._image_repo = repo
+        if "figures/" not in body:
+            return body
 
         def replace_image_path(match):
             image_filename = match.group(2)
@@ -368,64 +479,53 @@ class ReadMe:
                 return match.group(0)
             return f"{GITHUB_RAW}/{repo}/{image_filename}"
 
-        # Find all image tags in the body
-        img_tags = re.finditer(r'<img\s+[^>]*src="([^"]*)"[^>]*>', new_body)
-        for match in img_tags:
-            img_tag = match.group(0)
-            src = match.group(1)
-            # Only process if it's a relative path to figures
-            if "../figures/" in src:
-                image_path = re.search(regex_image_path, src)
-                if image_path:
-                    image_filename = image_path.group(2)
-                    if image_filename not in IGNORE_IMAGES:
-                        new_src = f"{GITHUB_RAW}/{repo}/{image_filename}"
-                        new_img_tag = img_tag.replace(src, new_src)
-                        new_body = new_body.replace(img_tag, new_img_tag)
-
-        # Process regular markdown images
-        return re.sub(regex_image_path, replace_image_path, new_body)
+        # One pass rewrites figure paths everywhere they appear, including
+        # inside <img> src attributes, with the same ignore handling.
+        return regex_image_path.sub(replace_image_path, body)
 
     def correct_file_locations(self, body: str) -> str:
+        if ".md" not in body:
+            return body
+
         def replace_path(match):
             matched_text = match.group(0)
-            if any(placeholder in matched_text for placeholder in IGNORE_DOCS):
+            if REGEX_IGNORE_DOC.search(matched_text):
                 return matched_text
 
             slug = match.group(2).split("/")[-1]
             fragment = match.group(3) or ""
             return f"(/docs/{slug}{fragment})"
 
-        return re.sub(regex_markdown_path, replace_path, body)
+        return regex_markdown_path.sub(replace_path, body)
 
     def convert_note_tags(self, body: str) -> str:
-        conversions = {
-            r"\[!NOTE\]": "📘",
-            r"\[!TIP\]": "👍",
-            r"\[!IMPORTANT\]": "📘",
-            r"\[!WARNING\]": "🚧",
-            r"\[!CAUTION\]": "❗️",
-        }
-
-        for old, new in conversions.items():
-            body = re.sub(old, new, body)
-
-        return body
+        if "[!" not in body:
+            return body
+        return regex_note_tag.sub(lambda match: NOTE_TAG_EMOJI[match.group(1)], body)
 
     def get_stable_version(self) -> str:
+        # The stable version cannot change mid-run, so fetch it once and
+        # reuse it instead of re-hitting the API.
+        if self._stable_version is not None:
+            return self._stable_version
+
         versions = get(f"{PREFIX}/version")
         if versions is None or not versions:
             raise ValueError("Failed to retrieve versions or no versions found")
 
         for version in versions:
             if version["is_stable"]:
-                return version["version_clean"]
+                self._stable_version = version["version_clean"]
+                return self._stable_version
 
         raise ValueError("No stable version found")
 
     def parse_images(self, markdown_text: str) -> str:
+        if "![" not in markdown_text:
+            return markdown_text
+
         def replace_image(match):
-            if any(ignore_image in match.groups()[1] for ignore_image in IGNORE_IMAGES):
+            if REGEX_IGNORE_IMAGE.search(match.groups()[1]):
                 return match.group(0)
             alt_text, image_src = match.groups()
 
@@ -434,23 +534,24 @@ class ReadMe:
             clean_src = nh3.clean(src_parts[0])
             style = "border-radius: 8px;"
 
-            # Parse and filter style parameters using allowlist
+            # Parse and filter style parameters using allowlist. The fragment
+            # is a simple key=value&key=value list, so a split loop beats
+            # parse_qs's dict-of-lists machinery.
             if len(src_parts) > 1:
-                try:
-                    params = parse_qs(src_parts[1])
-                    allowed_styles = []
-                    for key, values in params.items():
-                        if key in ALLOWED_CSS_PROPERTIES:
-                            # Sanitize both key and value
-                            safe_key = nh3.clean(key)
-                            safe_value = nh3.clean(values[0])
-                            allowed_styles.append(f"{safe_key}: {safe_value}")
-                        else:
-                            logging.warning(f"Ignoring disallowed CSS property '{key}'")
-                    if allowed_styles:
-                        style = f"{style} " + "; ".join(allowed_styles)
-                except (ValueError, ImportError):
-                    pass
+                allowed_styles = []
+                for pair in src_parts[1].split("&"):
+                    key, _, value = pair.partition("=")
+                    if not value:
+                        continue
+                    if key in ALLOWED_CSS_PROPERTIES:
+                        # The key is from the allowlist; only the value
+                        # needs sanitizing.
+                        safe_value = nh3.clean(unquote_plus(value))
+                        allowed_styles.append(f"{key}: {safe_value}")
+                    else:
+                        logging.warning(f"Ignoring disallowed CSS property '{key}'")
+                if allowed_styles:
+                    style = f"{style} " + "; ".join(allowed_styles)
 
             # Construct HTML with sanitized values
             if alt_text:
@@ -465,7 +566,7 @@ class ReadMe:
                     f' style="{style}" /></figure>'
                 )
 
-            return nh3.clean(unsafe_html, attributes={"img": {"src", "align", "style"}})
+            return nh3.clean(unsafe_html, attributes=IMAGE_ATTRIBUTES)
 
         return regex_images.sub(replace_image, markdown_text)
 
@@ -473,66 +574,95 @@ class ReadMe:
         delete(f"{PREFIX}/version/v{self.version}")
         logging.info(f"{GREEN}Successfully deleted version {self.version}{RESET}")
 
-    def _should_ignore_video(self, identifier: str, ignore_list: list[str]) -> bool:
+    def _should_ignore_video(
+        self, identifier: str, ignore_list: frozenset[str]
+    ) -> bool:
         return identifier in ignore_list
 
     def _create_video_block(self, block_type: str, block_data: dict[str, Any]) -> str:
         return f"[block:{block_type}]\n{json.dumps(block_data, indent=2)}\n[/block]"
 
-    def convert_cloudinary_videos(self, markdown_text: str) -> str:
+    def convert_videos(self, markdown_text: str) -> str:
+        """Convert Cloudinary and YouTube video links in a single pass.
+
+        Args:
+            markdown_text: The document body to convert
+
+        Returns:
+            The document body with video links converted to embed blocks.
+        """
+        if "res.cloudinary.com" not in markdown_text and "youtu" not in markdown_text:
+            return markdown_text
+
         def replace_video(match):
-            _, _, cloud_id, version, filename = match.groups()
-            if self._should_ignore_video(filename, IGNORE_CLOUDINARY):
-                return match.group(0)
-            new_url = f"https://res.cloudinary.com/{cloud_id}/video/upload/v{version}/{filename}"
-            block = {
-                "html": (
-                    f'<div style="display: flex;justify-content: center;">'
-                    f'<video width="640" height="360" '
-                    f'style="border-radius: 10px;" controls '
-                    f'poster="{new_url.replace(".mp4", ".jpg")}">'
-                    f'<source src="{new_url}" type="video/mp4">'
-                    f"Your browser does not support the video tag.</video></div>"
-                )
-            }
-            return self._create_video_block("html", block)
+            if match.group("cloudinary"):
+                return self._replace_cloudinary_video(match)
+            return self._replace_youtube_video(match)
 
-        return regex_cloudinary_video.sub(replace_video, markdown_text)
+        return regex_video_link.sub(replace_video, markdown_text)
+
+    def convert_cloudinary_videos(self, markdown_text: str) -> str:
+        return regex_cloudinary_video.sub(self._replace_cloudinary_video, markdown_text)
 
     def convert_youtube_videos(self, markdown_text: str) -> str:
-        def replace_youtube(match):
-            title, video_id = match.groups()
-            if self._should_ignore_video(video_id, IGNORE_YOUTUBE):
-                return match.group(0)
-            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-            embed_url = f"https://www.youtube.com/embed/{video_id}?feature=oembed"
-            thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
-            block = {
-                "html": (
-                    f'<iframe class="embedly-embed" '
-                    f'src="//cdn.embedly.com/widgets/media.html?'
-                    f"src={quote(embed_url, safe='')}&"
-                    f"display_name=YouTube&"
-                    f"url={quote(youtube_url, safe='')}&"
-                    f"image={quote(thumbnail_url, safe='')}&"
-                    f'type=text%2Fhtml&schema=youtube" '
-                    f'width="854" height="480" scrolling="no" '
-                    f'title="YouTube embed" frameborder="0" '
-                    f'allow="autoplay; fullscreen; encrypted-media; '
-                    f'picture-in-picture;" '
-                    f'allowfullscreen="true"></iframe>'
-                ),
-                "url": youtube_url,
-                "title": title,
-                "favicon": "https://www.youtube.com/favicon.ico",
-                "image": thumbnail_url,
-                "provider": "https://www.youtube.com/",
-                "href": youtube_url,
-                "typeOfEmbed": "youtube",
-            }
-            return self._create_video_block("embed", block)
-
-        return regex_youtube_link.sub(replace_youtube, markdown_text)
+        return regex_youtube_link.sub(self._replace_youtube_video, markdown_text)
+
+    def _replace_cloudinary_video(self, match) -> str:
+        filename = match.group("cl_file")
+        if self._should_ignore_video(filename, IGNORE_CLOUDINARY):
+            return match.group(0)
+        cloud_id = match.group("cl_cloud")
+        version = match.group("cl_version")
+        new_url = (
+            f"https://res.cloudinary.com/{cloud_id}/video/upload/v{version}/{filename}"
+        )
+        # The URL is known to end in .mp4, so slice the extension off rather
+        # than scanning the whole string with replace().
+        poster_url = f"{new_url[:-4]}.jpg"
+        block = {
+            "html": (
+                f'<div style="display: flex;justify-content: center;">'
+                f'<video width="640" height="360" '
+                f'style="border-radius: 10px;" controls '
+                f'poster="{poster_url}">'
+                f'<source src="{new_url}" type="video/mp4">'
+                f"Your browser does not support the video tag.</video></div>"
+            )
+        }
+        return self._create_video_block("html", block)
+
+    def _replace_youtube_video(self, match) -> str:
+        title = match.group("yt_title")
+        video_id = match.group("yt_id")
+        if self._should_ignore_video(video_id, IGNORE_YOUTUBE):
+            return match.group(0)
+        youtube_url = f"https://www.youtube.com/watch?v={video_id}"
+        embed_url = f"https://www.youtube.com/embed/{video_id}?feature=oembed"
+        thumbnail_url = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+        block = {
+            "html": (
+                f'<iframe class="embedly-embed" '
+                f'src="//cdn.embedly.com/widgets/media.html?'
+                f"src={quote(embed_url, safe='')}&"
+                f"display_name=YouTube&"
+                f"url={quote(youtube_url, safe='')}&"
+                f"image={quote(thumbnail_url, safe='')}&"
+                f'type=text%2Fhtml&schema=youtube" '
+                f'width="854" height="480" scrolling="no" '
+                f'title="YouTube embed" frameborder="0" '
+                f'allow="autoplay; fullscreen; encrypted-media; '
+                f'picture-in-picture;" '
+                f'allowfullscreen="true"></iframe>'
+            ),
+            "url": youtube_url,
+            "title": title,
+            "favicon": "https://www.youtube.com/favicon.ico",
+            "image": thumbnail_url,
+            "provider": "https://www.youtube.com/",
+            "href": youtube_url,
+            "typeOfEmbed": "youtube",
+        }
+        return self._create_video_block("embed", block)
 
     def insert_markdown_snippet(self, body: str, file_path: str) -> str:
         """Insert markdown snippets from referenced files.
@@ -544,15 +674,15 @@ class ReadMe:
         Returns:
             The document body with snippets inserted.
         """
+        if "!snippet[" not in body:
+            return body
 
         def replace_match(match):
             snippet_path = Path(file_path) / match.group(1)
             snippet_path = snippet_path.resolve()
 
             try:
-                with snippet_path.open() as f:
-                    unsafe_content = f.read()
-                    return self.sanitize_html(unsafe_content)
+                return _sanitized_snippet_cached(str(snippet_path))
 
             except Exception:  # noqa: BLE001
                 return f"[File not found or could not be read: {snippet_path}]"
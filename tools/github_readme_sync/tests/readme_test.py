@@ -324,6 +324,72 @@ This is a test document.""",
         )
         mock_put.assert_not_called()
 
+    @patch("tools.github_readme_sync.readme.get")
+    @patch("tools.github_readme_sync.readme.put")
+    @patch("tools.github_readme_sync.readme.post")
+    @patch.dict(os.environ, {"IMAGE_PATH": "user/repo"})
+    def test_create_or_update_doc_skips_unchanged(self, mock_post, mock_put, mock_get):
+        markdown = self.readme.process_markdown(
+            "This is a doc.", "docs/existing-doc.md", "existing-doc"
+        )
+        mock_get.return_value = {
+            "_id": "existing-doc-id",
+            "title": "Existing Doc",
+            "type": "basic",
+            "body": markdown,
+            "category": "category-id",
+            "hidden": False,
+            "order": 1,
+            "parentDoc": "parent-doc-id",
+        }
+        doc_id, created = self.readme.create_or_update_doc(
+            order=1,
+            category_id="category-id",
+            doc={
+                "title": "Existing Doc",
+                "body": "This is a doc.",
+                "slug": "existing-doc",
+            },
+            parent_id="parent-doc-id",
+            file_path="docs/existing-doc.md",
+        )
+        self.assertFalse(created)
+        self.assertEqual(doc_id, "existing-doc-id")
+        mock_put.assert_not_called()
+        mock_post.assert_not_called()
+
+    @patch("tools.github_readme_sync.readme.get")
+    @patch("tools.github_readme_sync.readme.put")
+    @patch("tools.github_readme_sync.readme.post")
+    @patch.dict(os.environ, {"IMAGE_PATH": "user/repo"})
+    def test_create_or_update_doc_updates_changed(self, mock_post, mock_put, mock_get):
+        mock_get.return_value = {
+            "_id": "existing-doc-id",
+            "title": "Old Title",
+            "type": "basic",
+            "body": "Old body.",
+            "category": "category-id",
+            "hidden": False,
+            "order": 1,
+            "parentDoc": "parent-doc-id",
+        }
+        mock_put.return_value = True
+        doc_id, created = self.readme.create_or_update_doc(
+            order=1,
+            category_id="category-id",
+            doc={
+                "title": "New Title",
+                "body": "New body.",
+                "slug": "existing-doc",
+            },
+            parent_id="parent-doc-id",
+            file_path="docs/existing-doc.md",
+        )
+        self.assertFalse(created)
+        self.assertEqual(doc_id, "existing-doc-id")
+        mock_put.assert_called_once()
+        mock_post.assert_not_called()
+
     @patch("tools.github_readme_sync.readme.get")
     @patch("tools.github_readme_sync.readme.post")
     @patch.dict(os.environ, {"IMAGE_PATH": "user/repo"})
@@ -473,6 +539,29 @@ This is a test document.""",
         expected_img = f'<img src="{GITHUB_RAW}/user/repo/image1.jpg" />'
         self.assertEqual(self.readme.correct_image_locations(img_tag), expected_img)
 
+    @patch.dict(os.environ, {"IMAGE_PATH": "user/repo"})
+    def test_correct_image_locations_multiple_on_one_line(self):
+        """Two figure references on one line are rewritten independently."""
+        img_tags = (
+            '<img src="../figures/image1.png" /> <img src="../figures/image2.png" />'
+        )
+        expected_img_tags = (
+            f'<img src="{GITHUB_RAW}/user/repo/image1.png" /> '
+            f'<img src="{GITHUB_RAW}/user/repo/image2.png" />'
+        )
+        self.assertEqual(
+            self.readme.correct_image_locations(img_tags), expected_img_tags
+        )
+
+        markdown = "![One](../figures/image1.png) ![Two](../figures/image2.png)"
+        expected_markdown = (
+            f"![One]({GITHUB_RAW}/user/repo/image1.png) "
+            f"![Two]({GITHUB_RAW}/user/repo/image2.png)"
+        )
+        self.assertEqual(
+            self.readme.correct_image_locations(markdown), expected_markdown
+        )
+
     @patch.dict(os.environ, {"IMAGE_PATH": ""})
     def test_correct_image_locations_no_repo_env(self):
         body = "![Image 1](../figures/image1.png)"
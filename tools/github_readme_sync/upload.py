@@ -63,29 +63,29 @@ def process_children(
     path_prefix="",
     parent_doc_id=None,
 ):
-    # Process the current level's children
-    for i, child in enumerate(parent["children"]):
-        doc = load_doc(file_path, f"{path_prefix}{parent['slug']}", child)
+    # Walk the hierarchy depth-first with an explicit stack instead of
+    # recursion. Children are pushed in reverse so they pop in order.
+    stack = [
+        (child, i, f"{path_prefix}{parent['slug']}", parent_doc_id)
+        for i, child in reversed(list(enumerate(parent["children"])))
+    ]
+    while stack:
+        child, order, doc_path, parent_id = stack.pop()
+        doc = load_doc(file_path, doc_path, child)
         doc_id, created = rdme.create_or_update_doc(
-            order=i,
+            order=order,
             category_id=cat_id,
             doc=doc,
-            parent_id=parent_doc_id,
-            file_path=f"{file_path}/{path_prefix}{parent['slug']}",
+            parent_id=parent_id,
+            file_path=f"{file_path}/{doc_path}",
         )
-        print_child(path_prefix.count("/"), doc, created)
+        print_child(doc_path.count("/"), doc, created)
         set_do_not_delete(to_be_deleted, child["slug"])
 
-        # If this child has children, call the function recursively
         if child.get("children"):
-            process_children(
-                parent=child,
-                cat_id=cat_id,
-                file_path=file_path,
-                rdme=rdme,
-                to_be_deleted=to_be_deleted,
-                path_prefix=f"{path_prefix}{parent['slug']}/",
-                parent_doc_id=doc_id,
+            stack.extend(
+                (grandchild, i, f"{doc_path}/{child['slug']}", doc_id)
+                for i, grandchild in reversed(list(enumerate(child["children"])))
             )
 
 
@@ -124,9 +124,11 @@ def print_child(level: int, doc: dict, created: bool):
 
 def load_doc(file_path: str, category_slug: str, child: dict):
     file_path = Path(file_path) / category_slug / f"{child['slug']}.md"
-    if not file_path.exists():
-        raise ValueError(f"File {file_path} does not exist")
-
-    with file_path.open(encoding="utf-8") as file:
-        body = file.read()
-        return process_markdown(body, child["slug"])
+    # Open directly instead of probing with exists() first; this saves a stat
+    # per doc and avoids the race between the check and the open.
+    try:
+        with file_path.open(encoding="utf-8") as file:
+            body = file.read()
+    except FileNotFoundError:
+        raise ValueError(f"File {file_path} does not exist") from None
+    return process_markdown(body, child["slug"])